@@ -1,93 +1,56 @@
 import streamlit as st
-import fitz  # PyMuPDF
-from transformers import pipeline
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-import textwrap
-import re
-import tempfile
-from bert_score import score
+import diskcache
 import numpy as np
+# Text processing, model loading, batching and scoring are shared with the command-line tool
+from summarizer import (MODEL_NAME, SUMMARY_CACHE_DIR, open_pdf, clean_text, chunk_text,
+                        save_summary_to_pdf, load_summarizer, summarize_chunks, get_bert_scorer)
+
+MODEL_CHOICES = [MODEL_NAME] + [m for m in ("sshleifer/distilbart-cnn-12-6", "facebook/bart-large-cnn")
+                                if m != MODEL_NAME]
 
 # ---------------------------------------------------------
 # 1. Extract text from PDF
 # ---------------------------------------------------------
-def extract_text_from_pdf(pdf_path):
+def extract_text_from_pdf(source):
     text = ""
     try:
-        with fitz.open(pdf_path) as doc:
-            for page in doc:
-                text += page.get_text()
+        # Accepts a file path or the raw bytes of an uploaded file
+        with open_pdf(source) as doc:
+            text = "".join(page.get_text() for page in doc)
     except Exception as e:
         st.error(f"Error reading PDF: {e}")
     return text
 
 # ---------------------------------------------------------
-# 2. Clean the text
-# ---------------------------------------------------------
-def clean_text(text):
-    text = re.sub(r'\s+', ' ', text).strip()
-    text = re.sub(r'Page\s\d+', '', text, flags=re.IGNORECASE)
-    return text
-
-# ---------------------------------------------------------
-# 3. Chunk the text
+# 2. Load the models (cached across Streamlit reruns)
 # ---------------------------------------------------------
-def chunk_text(text, max_words=400):
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-    chunks, current_chunk, words = [], "", 0
-    for sent in sentences:
-        sent_words = len(sent.split())
-        if words + sent_words > max_words and current_chunk:
-            chunks.append(current_chunk.strip())
-            current_chunk, words = sent, sent_words
-        else:
-            current_chunk += " " + sent
-            words += sent_words
-    if current_chunk:
-        chunks.append(current_chunk.strip())
-    return chunks
+# Keep only the selected model in memory; switching models evicts the previous one
+@st.cache_resource(max_entries=1)
+def get_summarizer(model_name):
+    return load_summarizer(model_name)
 
-# ---------------------------------------------------------
-# 4. Save summary as PDF
-# ---------------------------------------------------------
-def save_summary_to_pdf(summary_text, output_pdf="summary_output.pdf"):
-    c = canvas.Canvas(output_pdf, pagesize=letter)
-    width, height = letter
-    y = height - 50
-    margin = 50
-
-    text_object = c.beginText(margin, y)
-    text_object.setFont("Times-Roman", 12)
-    wrapped_text = textwrap.wrap(summary_text, width=90)
-
-    for line in wrapped_text:
-        text_object.textLine(line)
-        if text_object.getY() < margin:
-            c.drawText(text_object)
-            c.showPage()
-            text_object = c.beginText(margin, height - margin)
-            text_object.setFont("Times-Roman", 12)
-
-    c.drawText(text_object)
-    c.save()
-    return output_pdf
+@st.cache_resource
+def load_summary_cache():
+    return diskcache.Cache(SUMMARY_CACHE_DIR)
 
 # ---------------------------------------------------------
-# 5. Streamlit UI
+# 3. Streamlit UI
 # ---------------------------------------------------------
 st.set_page_config(page_title="PDF Summarizer", page_icon="📄", layout="wide")
 st.title("📘 PDF Summarizer")
 
 uploaded_file = st.file_uploader("📤 Upload a PDF file", type=["pdf"])
 
-if uploaded_file:
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-        tmp_file.write(uploaded_file.read())
-        pdf_path = tmp_file.name
+model_name = st.selectbox("🧠 Summarization model", MODEL_CHOICES,
+                          help="DistilBART is about twice as fast; BART-large-CNN is slightly more accurate.")
 
+# Warm the cached model while the user picks a file
+with st.spinner("⚡ Loading summarization model..."):
+    summarizer = get_summarizer(model_name)
+
+if uploaded_file:
     with st.spinner("🔍 Extracting and cleaning text..."):
-        raw_text = extract_text_from_pdf(pdf_path)
+        raw_text = extract_text_from_pdf(uploaded_file.getvalue())
         cleaned_text = clean_text(raw_text)
 
     if not cleaned_text or len(cleaned_text.split()) < 40:
@@ -97,15 +60,11 @@ if uploaded_file:
         st.write("✂️ Splitting text into chunks...")
 
         chunks = chunk_text(cleaned_text, max_words=400)
-        summarizer = pipeline("summarization", model="facebook/bart-large-cnn", device=-1)
 
-        summaries = []
+        valid_chunks = [chunk for chunk in chunks if len(chunk.split()) > 40]
         progress = st.progress(0)
-        for i, chunk in enumerate(chunks):
-            progress.progress((i + 1) / len(chunks))
-            if len(chunk.split()) > 40:
-                summary = summarizer(chunk, max_length=150, min_length=40, do_sample=False)[0]['summary_text']
-                summaries.append(summary)
+        summaries = summarize_chunks(summarizer, valid_chunks, cache=load_summary_cache(),
+                                     model_name=model_name, progress=progress.progress)
 
         final_summary = "\n\n".join(summaries)
 
@@ -126,8 +85,7 @@ if uploaded_file:
         # Optional: Evaluate BERTScore
         if st.checkbox("🔬 Evaluate Summary Quality (BERTScore)"):
             st.info("Evaluating summary vs original text...")
-            valid_chunks = chunks[:len(summaries)]
-            P, R, F1 = score(summaries, valid_chunks, lang="en", verbose=True)
+            P, R, F1 = get_bert_scorer().score(summaries, valid_chunks, verbose=True)
             st.write(f"**Precision:** {P.mean().item():.4f}")
             st.write(f"**Recall:** {R.mean().item():.4f}")
             st.write(f"**F1 Score:** {F1.mean().item():.4f}")